@@ -38,7 +38,7 @@ from .const import (
     BATTERY_MODE_EXCLUDES,
 )
 from .modbus_client import DeyeModbusClient
-from .definition_loader import load_definition
+from .definition_loader import group_by_platform, load_definition
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -117,6 +117,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "last_error": None,
         }
         meta = hass.data[DOMAIN][entry.entry_id]["meta"]
+        # Raw register words from the last successful poll: address -> (value, monotonic ts)
+        raw_registers: dict[int, tuple[int, float]] = hass.data[DOMAIN][entry.entry_id].setdefault(
+            "registers", {}
+        )
 
         last_ts: float = 0
         last_full_read: float = 0
@@ -159,6 +163,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                         )
                         for idx, reg_val in enumerate(rr.registers):
                             registers[start + idx] = reg_val
+                            raw_registers[start + idx] = (reg_val, read_ts)
                         successful_spans += 1
                     except Exception as err:  # noqa: BLE001
                         _LOGGER.warning("Definition batch read failed (%s, %s): %s", start, count, err)
@@ -242,6 +247,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await def_coordinator.async_config_entry_first_refresh()
         hass.data[DOMAIN][entry.entry_id]["definitions"] = {
             "items": def_items,
+            "items_by_platform": group_by_platform(def_items),
             "coordinator": def_coordinator,
         }
 
@@ -513,22 +519,22 @@ def _decode_item(item, regs: list[int]) -> Any:
         return None
 
     # Apply offset, mask/divide/scale if present
-    if hasattr(item, "offset") and item.offset:
+    if item.offset:
         try:
             val = val - item.offset  # type: ignore[operator]
         except Exception:  # noqa: BLE001
             pass
-    if hasattr(item, "mask") and item.mask is not None:
+    if item.mask is not None:
         try:
             val = val & item.mask  # type: ignore[operator]
         except Exception:  # noqa: BLE001
             pass
-    if hasattr(item, "divide") and item.divide:
+    if item.divide:
         try:
             val = val / item.divide  # type: ignore[operator]
         except Exception:  # noqa: BLE001
             pass
-    scale = _SCALE_OVERRIDES.get(getattr(item, "key", None), item.scale)
+    scale = _SCALE_OVERRIDES.get(item.key, item.scale)
     if scale:
         try:
             val = val * scale  # type: ignore[operator]
@@ -537,7 +543,7 @@ def _decode_item(item, regs: list[int]) -> Any:
 
     if item.lookup and isinstance(val, int):
         # Special handling for time_of_use: bit0 commonly acts as enable; other bits select the schedule
-        if getattr(item, "key", "") == "time_of_use":
+        if item.key == "time_of_use":
             # Some firmwares use bit0 as enable; drop it for lookup but keep raw if no match
             base = val & ~1
             decoded = item.lookup.get(val) or item.lookup.get(base)
@@ -551,9 +557,9 @@ def _decode_item(item, regs: list[int]) -> Any:
                 val = val
             else:
                 val = decoded
-        elif getattr(item, "key", "") == "meter":
+        elif item.key == "meter":
             masked = val
-            if hasattr(item, "mask") and item.mask:
+            if item.mask:
                 masked = val & item.mask
             mapped = item.lookup.get(masked)
             if mapped is None:
@@ -588,7 +594,7 @@ def _filter_items_by_mode(items, battery_mode: int | None):
     """Filter definition items based on battery control mode."""
     if battery_mode is None:
         return items
-    excludes = BATTERY_MODE_EXCLUDES.get(battery_mode, set())
+    excludes = BATTERY_MODE_EXCLUDES.get(battery_mode)
     if not excludes:
         return items
     return [item for item in items if item.key not in excludes]
@@ -31,6 +31,8 @@ DEFAULT_SLAVE_ID = 1
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=2)
 DEFINITION_SCAN_INTERVAL = timedelta(seconds=1)
 SLOW_POLL_INTERVAL = timedelta(seconds=5)
+# Polled register words younger than this may stand in for a read-before-write
+REGISTER_SNAPSHOT_MAX_AGE = SLOW_POLL_INTERVAL * 2
 DEFAULT_INVERTER_DEFINITION = "deye_hybrid"
 
 # High-frequency poll spans (address, count) for realtime values
@@ -44,8 +46,8 @@ FAST_POLL_SPANS: list[tuple[int, int]] = [
 
 # Battery control mode-specific visibility (keys to exclude per mode)
 # Mode values come from the definition lookup for "battery_control_mode"
-BATTERY_MODE_EXCLUDES: dict[int, set[str]] = {
-    0: {
+BATTERY_MODE_EXCLUDES: dict[int, frozenset[str]] = {
+    0: frozenset({
         # Hide SOC-based controls when using lead-acid
         "battery_shutdown_soc",
         "battery_restart_soc",
@@ -60,8 +62,8 @@ BATTERY_MODE_EXCLUDES: dict[int, set[str]] = {
         "program_6_soc",
         "smartload_off",
         "smartload_on",
-    },
-    1: {
+    }),
+    1: frozenset({
         "battery_equalization",
         "battery_absorption",
         "battery_float",
@@ -83,5 +85,5 @@ BATTERY_MODE_EXCLUDES: dict[int, set[str]] = {
         "battery_resistance",
         "smartload_off_voltage",
         "smartload_on_voltage",
-    },  # Lithium: hide lead-acid tuning
+    }),  # Lithium: hide lead-acid tuning
 }
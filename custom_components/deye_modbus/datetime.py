@@ -14,7 +14,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpda
 
 from .const import DOMAIN
 from .definition_loader import DefinitionItem
-from .device_info import build_base_device, build_device_for_group
+from .device_info import build_base_device, group_device_builder
 
 
 async def async_setup_entry(
@@ -26,14 +26,13 @@ async def async_setup_entry(
         return
 
     coordinator = defs["coordinator"]
-    items: list[DefinitionItem] = defs["items"]
+    items: list[DefinitionItem] = defs["items_by_platform"].get("datetime", [])
 
     base_device_info = build_base_device(entry.entry_id, entry.data)
+    device_for = group_device_builder(entry.entry_id, base_device_info)
 
     entities: list[DeyeDefinitionDateTime] = []
     for item in items:
-        if item.platform != "datetime":
-            continue
         desc = DateTimeEntityDescription(
             key=item.key,
             name=item.name,
@@ -45,7 +44,7 @@ async def async_setup_entry(
                 coordinator=coordinator,
                 description=desc,
                 entry_id=entry.entry_id,
-                device_info=build_device_for_group(item, entry.entry_id, base_device_info),
+                device_info=device_for(item),
             )
         )
 
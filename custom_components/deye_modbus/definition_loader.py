@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -54,6 +54,11 @@ class DefinitionItem:
     divide: float | None = None
     group_name: str | None = None
     offset: float | None = None
+    # Normalized group_name used to key group sub-devices ("" for the base device)
+    group_key: str = field(init=False, default="")
+
+    def __post_init__(self) -> None:
+        self.group_key = (self.group_name or "").strip()
 
 
 def load_definition(def_path: Path) -> list[DefinitionItem]:
@@ -64,6 +69,8 @@ def load_definition(def_path: Path) -> list[DefinitionItem]:
         raise ValueError(f"Failed to load definition file {def_path}: {err}") from err
 
     items: list[DefinitionItem] = []
+    # (platform, key) pairs already emitted; later duplicates would collide on unique_id
+    seen: set[tuple[str, str]] = set()
 
     params = data.get("parameters", [])
     for group_entry in params:
@@ -115,6 +122,10 @@ def load_definition(def_path: Path) -> list[DefinitionItem]:
                         base_lookup.append(entry)
                     item["lookup"] = base_lookup
 
+            if (platform, key) in seen:
+                continue
+            seen.add((platform, key))
+
             scale = item.get("scale")
             lookup = _parse_lookup(item.get("lookup"))
             range_min = None
@@ -151,6 +162,14 @@ def load_definition(def_path: Path) -> list[DefinitionItem]:
     return items
 
 
+def group_by_platform(items: list[DefinitionItem]) -> dict[str, list[DefinitionItem]]:
+    """Bucket definition items by entity platform, preserving definition order."""
+    by_platform: dict[str, list[DefinitionItem]] = {}
+    for item in items:
+        by_platform.setdefault(item.platform, []).append(item)
+    return by_platform
+
+
 def _slug(name: str) -> str:
     """Create a simple slug key."""
     return (
@@ -2,52 +2,59 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 from .const import DOMAIN, CONF_HOST, CONF_PORT, CONF_DEVICE
 from .definition_loader import DefinitionItem
 
 
-def build_base_name(entry_data: dict) -> str:
-    """Build a human-readable name for the base device."""
+def build_base_device(entry_id: str, entry_data: dict) -> dict[str, Any]:
+    """Build device info dict for the base inverter device."""
+    # Name and configuration URL both derive from the connection settings; read them once
     if host := entry_data.get(CONF_HOST):
         port = entry_data.get(CONF_PORT)
-        base = f"Deye Inverter ({host}:{port})" if port else f"Deye Inverter ({host})"
+        name = f"Deye Inverter ({host}:{port})" if port else f"Deye Inverter ({host})"
+        config_url = f"http://{host}"
     elif device := entry_data.get(CONF_DEVICE):
-        base = f"Deye Inverter ({device})"
+        name, config_url = f"Deye Inverter ({device})", None
     else:
-        base = "Deye Inverter"
-    return base
-
-
-def build_config_url(entry_data: dict) -> str | None:
-    """Build configuration URL for TCP connections."""
-    if host := entry_data.get(CONF_HOST):
-        return f"http://{host}"
-    return None
-
-
-def build_base_device(entry_id: str, entry_data: dict) -> dict[str, Any]:
-    """Build device info dict for the base inverter device."""
+        name, config_url = "Deye Inverter", None
     return {
         "identifiers": {(DOMAIN, entry_id)},
         "manufacturer": "Deye",
-        "name": build_base_name(entry_data),
-        "configuration_url": build_config_url(entry_data),
+        "name": name,
+        "configuration_url": config_url,
     }
 
 
-def build_device_for_group(
-    item: DefinitionItem, entry_id: str, base: dict[str, Any]
+def group_device_builder(
+    entry_id: str, base: dict[str, Any]
+) -> Callable[[DefinitionItem], dict[str, Any]]:
+    """Return a per-entry builder that creates each group's device info only once."""
+    # One via_device tuple and one dict per group, shared by every entity in it
+    via_device = (DOMAIN, entry_id)
+    cache: dict[str, dict[str, Any]] = {"": base}
+
+    def _device_for(item: DefinitionItem) -> dict[str, Any]:
+        group = item.group_key
+        device = cache.get(group)
+        if device is None:
+            device = cache[group] = _group_device(group, entry_id, base, via_device)
+        return device
+
+    return _device_for
+
+
+def _group_device(
+    group: str, entry_id: str, base: dict[str, Any], via_device: tuple[str, str]
 ) -> dict[str, Any]:
-    """Build device info for a grouped sub-device (e.g., Battery, Grid, etc.)."""
-    group = (item.group_name or "").strip()
-    if not group:
-        return base
+    """Build the device info dict for a non-empty group name."""
+    # base always comes from build_base_device, so index it directly
     return {
         "identifiers": {(DOMAIN, f"{entry_id}_{group}")},
-        "manufacturer": base.get("manufacturer"),
-        "name": f"{base.get('name')} - {group}",
-        "via_device": (DOMAIN, entry_id),
-        "configuration_url": base.get("configuration_url"),
+        "manufacturer": base["manufacturer"],
+        "name": f"{base['name']} - {group}",
+        "via_device": via_device,
+        "configuration_url": base["configuration_url"],
     }
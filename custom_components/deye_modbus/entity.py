@@ -0,0 +1,34 @@
+"""Shared entity base classes for definition-driven platforms."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
+
+# Marks "no state written yet" for the per-entity change check
+_UNSET: Any = object()
+
+
+class DeyeChangeOnlyEntity(CoordinatorEntity):
+    """Coordinator entity that writes state only when its own value or availability changed."""
+
+    # HA base classes keep a __dict__ for _attr_* state; only our own fields are slotted,
+    # here and in every platform entity.
+    __slots__ = ("_key", "_last")
+
+    def __init__(self, coordinator: DataUpdateCoordinator[dict[str, Any]], key: str) -> None:
+        super().__init__(coordinator)
+        self._key = key
+        self._last: Any = _UNSET
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Skip the state write when this entity's key and availability are unchanged."""
+        data = self.coordinator.data
+        current = (self.coordinator.last_update_success, data.get(self._key) if data else None)
+        if current == self._last:
+            return
+        self._last = current
+        super()._handle_coordinator_update()
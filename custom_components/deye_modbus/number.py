@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING
+from typing import Any
 import logging
 
 from homeassistant.components.number import (
@@ -20,12 +20,12 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpda
 
 from .const import DOMAIN
 from .definition_loader import DefinitionItem
-from .device_info import build_base_device, build_device_for_group
+from .device_info import build_base_device, group_device_builder
 
 _LOGGER = logging.getLogger(__name__)
 
 # Keys allowed to perform writes (ToU program controls)
-_WRITABLE_NUMBER_KEYS = {
+_WRITABLE_NUMBER_KEYS: frozenset[str] = frozenset({
     # Program power
     "program_1_power",
     "program_2_power",
@@ -58,6 +58,16 @@ _WRITABLE_NUMBER_KEYS = {
     "battery_low_soc",
     "battery_grid_charging_start",
     "battery_generator_charging_start",
+})
+
+# Definition unit spellings mapped to Home Assistant units
+_UNIT_MAP: dict[str, str] = {
+    "A": UnitOfElectricCurrent.AMPERE,
+    "a": UnitOfElectricCurrent.AMPERE,
+    "W": UnitOfPower.WATT,
+    "w": UnitOfPower.WATT,
+    "kWh": UnitOfEnergy.KILO_WATT_HOUR,
+    "kwh": UnitOfEnergy.KILO_WATT_HOUR,
 }
 
 async def async_setup_entry(
@@ -69,36 +79,39 @@ async def async_setup_entry(
         return
 
     coordinator = sol["coordinator"]
-    items: list[DefinitionItem] = sol["items"]
+    items: list[DefinitionItem] = sol["items_by_platform"].get("number", [])
 
     base_device_info = build_base_device(entry.entry_id, entry.data)
-    entities: list[DeyeDefinitionNumber] = []
-
-    for item in items:
-        if item.platform != "number":
-            continue
-
-        desc = _description_for(item)
-        if not desc:
-            continue
-
-        entities.append(
-            DeyeDefinitionNumber(
-                coordinator=coordinator,
-                description=desc,
-                entry_id=entry.entry_id,
-                definition=item,
-                device_info=build_device_for_group(item, entry.entry_id, base_device_info),
-            )
+    device_for = group_device_builder(entry.entry_id, base_device_info)
+
+    async_add_entities(
+        DeyeDefinitionNumber(
+            coordinator=coordinator,
+            description=desc,
+            entry_id=entry.entry_id,
+            definition=item,
+            device_info=device_for(item),
         )
-
-    if entities:
-        async_add_entities(entities)
+        for item in items
+        if (desc := _description_for(item)) is not None
+    )
 
 
 class DeyeDefinitionNumber(CoordinatorEntity, NumberEntity):
     """Number entity driven by external definition (read-only)."""
 
+    __slots__ = (
+        "_entry_id",
+        "_definition",
+        "_writable",
+        "_client",
+        "_address",
+        "_writes_in_flight",
+        "_scale_factor",
+        "_range_min",
+        "_range_max",
+    )
+
     _attr_has_entity_name = True
     _attr_mode = NumberMode.BOX
     _attr_entity_category = EntityCategory.CONFIG
@@ -117,31 +130,66 @@ class DeyeDefinitionNumber(CoordinatorEntity, NumberEntity):
         self._attr_device_info = device_info
         self._entry_id = entry_id
         self._definition = definition
+        self._writable = description.key in _WRITABLE_NUMBER_KEYS
+        # The client lives for the whole config entry; platforms are set up after it is stored
+        self._client = coordinator.hass.data[DOMAIN][entry_id]["client"]
+        self._address = definition.registers[0] if definition.registers else None
+        self._writes_in_flight = 0
+        # Conversion parameters are fixed per definition; resolve them once
+        self._scale_factor = _scale_factor(definition.scale)
+        self._range_min = definition.range_min
+        self._range_max = definition.range_max
 
     @property
     def native_value(self):
         return self.coordinator.data.get(self.entity_description.key)
 
-    async def async_set_native_value(self, value):
-        if self.entity_description.key not in _WRITABLE_NUMBER_KEYS:
+    async def async_set_native_value(self, value, *, force: bool = False):
+        """Write the value; ``force`` rewrites even if the last poll already matches."""
+        if not self._writable:
             raise HomeAssistantError("Writes not implemented for this entity")
 
         raw = self._to_raw(value)
-        registers = self._definition.registers
-        if not registers:
+        address = self._address
+        if address is None:
             raise HomeAssistantError("No register defined for this number")
-        address = registers[0]
 
-        client = self.coordinator.hass.data[DOMAIN][self._entry_id]["client"]
-        try:
-            await client.async_write_register(address, raw)
-            _LOGGER.info(
-                "Wrote number %s (value=%s -> raw=%s) to register %s",
+        # Skip the write and its verification read when the last poll already holds this value.
+        # An earlier write still in flight would overwrite the poll, so never skip during one.
+        current = self.coordinator.data.get(self.entity_description.key)
+        if (
+            not force
+            and not self._writes_in_flight
+            and isinstance(current, (int, float))
+            and int(round(current / self._scale_factor)) == raw
+        ):
+            _LOGGER.debug(
+                "Number %s already at raw %s (register %s); skipping write",
                 self.entity_description.key,
-                value,
                 raw,
                 address,
             )
+            return
+
+        self._writes_in_flight += 1
+        try:
+            await self._async_write_verified(address, raw, value)
+        finally:
+            self._writes_in_flight -= 1
+
+    async def _async_write_verified(self, address: int, raw: int, value: Any) -> None:
+        """Write ``raw`` to ``address``, verify it and reflect it in the coordinator data."""
+        client = self._client
+        try:
+            await client.async_write_register(address, raw)
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(
+                    "Wrote number %s (value=%s -> raw=%s) to register %s",
+                    self.entity_description.key,
+                    value,
+                    raw,
+                    address,
+                )
         except Exception as err:  # noqa: BLE001
             _LOGGER.error(
                 "Failed to write number %s (value=%s -> raw=%s) to register %s: %s",
@@ -194,18 +242,29 @@ class DeyeDefinitionNumber(CoordinatorEntity, NumberEntity):
                 err,
             )
 
-        await self.coordinator.async_request_refresh()
+        # Reflect the written value straight away; only this entity reads this key,
+        # so update it in place instead of re-broadcasting the whole data dict.
+        self.coordinator.data[self.entity_description.key] = raw * self._scale_factor
+        if self.hass is not None:  # None until added to a platform
+            self.async_write_ha_state()
+
+        # Confirm from the inverter in the background; the service call returns now
+        self.coordinator.hass.async_create_task(self.coordinator.async_request_refresh())
 
     def _to_raw(self, value: Any) -> int:
         """Convert native value to raw register value applying inverse scale."""
-        try:
-            val = float(value)
-        except Exception as err:  # noqa: BLE001
-            raise HomeAssistantError(f"Invalid number value: {value}") from err
+        if isinstance(value, (int, float)):
+            # HA passes floats from the UI; only coerce other types
+            val = value
+        else:
+            try:
+                val = float(value)
+            except Exception as err:  # noqa: BLE001
+                raise HomeAssistantError(f"Invalid number value: {value}") from err
 
         # Validate bounds before scaling
-        range_min = getattr(self._definition, "range_min", None)
-        range_max = getattr(self._definition, "range_max", None)
+        range_min = self._range_min
+        range_max = self._range_max
 
         if range_min is not None and val < range_min:
             raise HomeAssistantError(
@@ -216,17 +275,7 @@ class DeyeDefinitionNumber(CoordinatorEntity, NumberEntity):
                 f"Value {val} is above maximum allowed value {range_max}"
             )
 
-        scale = self._definition.scale
-        if isinstance(scale, (int, float)) and scale:
-            val = val / scale
-        # For list scales (e.g., [1,10]) we only used first element on decode; invert similarly
-        elif isinstance(scale, list) and scale:
-            factor = scale[0]
-            if len(scale) >= 2 and scale[1]:
-                factor = factor / scale[1]
-            val = val / factor
-
-        raw_value = int(round(val))
+        raw_value = int(round(val / self._scale_factor))
 
         # Additional safety check: ensure raw value fits in 16-bit register
         if raw_value < 0 or raw_value > 65535:
@@ -237,24 +286,29 @@ class DeyeDefinitionNumber(CoordinatorEntity, NumberEntity):
         return raw_value
 
 
+def _scale_factor(scale: Any) -> float:
+    """Return the decode scale factor that native values are divided by on write."""
+    if isinstance(scale, (int, float)) and scale:
+        return scale
+    # For list scales (e.g., [1,10]) we only used first element on decode; invert similarly
+    if isinstance(scale, list) and scale:
+        factor = scale[0]
+        if len(scale) >= 2 and scale[1]:
+            factor = factor / scale[1]
+        return factor
+    return 1
+
+
 def _description_for(item: DefinitionItem) -> NumberEntityDescription | None:
     """Map definition item to a number description (read-only)."""
-    native_unit = None
-    if item.unit in ("A", "a"):
-        native_unit = UnitOfElectricCurrent.AMPERE
-    elif item.unit in ("W", "w"):
-        native_unit = UnitOfPower.WATT
-    elif item.unit in ("kWh", "kwh"):
-        native_unit = UnitOfEnergy.KILO_WATT_HOUR
-
-    fallback_unit = native_unit or item.unit
+    fallback_unit = _UNIT_MAP.get(item.unit, item.unit)
 
     return NumberEntityDescription(
         key=item.key,
         name=item.name,
         native_unit_of_measurement=fallback_unit,
-        native_min_value=item.range_min if hasattr(item, "range_min") else None,
-        native_max_value=item.range_max if hasattr(item, "range_max") else None,
+        native_min_value=item.range_min,
+        native_max_value=item.range_max,
         native_step=1,
         icon=item.icon,
     )
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 import logging
+import time as _time
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
@@ -13,14 +14,14 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
 
-from .const import DOMAIN
+from .const import DOMAIN, REGISTER_SNAPSHOT_MAX_AGE
 from .definition_loader import DefinitionItem
-from .device_info import build_base_device, build_device_for_group
+from .device_info import build_base_device, group_device_builder
 
 _LOGGER = logging.getLogger(__name__)
 
 # Keys allowed to perform writes (single-register selects)
-_WRITABLE_SELECT_KEYS = {
+_WRITABLE_SELECT_KEYS: frozenset[str] = frozenset({
     "time_of_use",
     "program_1_charging",
     "program_2_charging",
@@ -28,7 +29,7 @@ _WRITABLE_SELECT_KEYS = {
     "program_4_charging",
     "program_5_charging",
     "program_6_charging",
-}
+})
 
 
 async def async_setup_entry(
@@ -40,34 +41,40 @@ async def async_setup_entry(
         return
 
     coordinator = defs["coordinator"]
-    items: list[DefinitionItem] = defs["items"]
+    items: list[DefinitionItem] = defs["items_by_platform"].get("select", [])
 
     base_device_info = build_base_device(entry.entry_id, entry.data)
+    device_for = group_device_builder(entry.entry_id, base_device_info)
 
-    entities: list[DeyeDefinitionSelect] = []
-    for item in items:
-        if item.platform != "select":
-            continue
-        desc = _description_for(item)
-        if not desc:
-            continue
-        entities.append(
+    async_add_entities(
+        (
             DeyeDefinitionSelect(
                 coordinator=coordinator,
                 description=desc,
                 entry_id=entry.entry_id,
                 definition=item,
-                device_info=build_device_for_group(item, entry.entry_id, base_device_info),
+                device_info=device_for(item),
             )
-        )
-
-    if entities:
-        async_add_entities(entities)
+            for item in items
+            if (desc := _description_for(item)) is not None
+        ),
+        update_before_add=False,
+    )
 
 
 class DeyeDefinitionSelect(CoordinatorEntity, SelectEntity):
     """Select entity driven by external definition (writes supported for whitelisted keys)."""
 
+    __slots__ = (
+        "_key",
+        "_entry_id",
+        "_definition",
+        "_writable",
+        "_reverse_lookup",
+        "_client",
+        "_registers",
+    )
+
     _attr_entity_category = EntityCategory.CONFIG
     _attr_has_entity_name = True
 
@@ -81,14 +88,22 @@ class DeyeDefinitionSelect(CoordinatorEntity, SelectEntity):
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
+        self._key = description.key
         self._attr_unique_id = f"{entry_id}_def_select_{description.key}"
         self._attr_device_info = device_info
         self._entry_id = entry_id
         self._definition = definition
+        self._writable = description.key in _WRITABLE_SELECT_KEYS
+        # Client and register snapshot live for the whole entry; avoid walking hass.data per write
+        entry_data = coordinator.hass.data[DOMAIN][entry_id]
+        self._client = entry_data["client"]
+        self._registers: dict[int, tuple[int, float]] = entry_data.setdefault("registers", {})
+        # Lookup tables are fixed per definition; map options back to raw values once
+        self._reverse_lookup = _reverse_lookup(definition.lookup) if definition.lookup else {}
 
     @property
     def current_option(self) -> str | None:
-        return self.coordinator.data.get(self.entity_description.key)
+        return self.coordinator.data.get(self._key)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
@@ -99,45 +114,55 @@ class DeyeDefinitionSelect(CoordinatorEntity, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         # Only allow writes for a small set of single-register selects
-        if self.entity_description.key not in _WRITABLE_SELECT_KEYS:
+        if not self._writable:
             raise HomeAssistantError("Writes not implemented for this entity")
 
         if not self._definition.lookup:
             raise HomeAssistantError("No lookup defined for this select")
 
         # Map option back to numeric key
-        reverse = {v: k for k, v in self._definition.lookup.items()}
-        if option not in reverse:
+        value = self._reverse_lookup.get(option)
+        if value is None:
             raise HomeAssistantError(f"Invalid option: {option}")
-        value = reverse[option]
 
         registers = self._definition.registers
         if not registers:
             raise HomeAssistantError("No register defined for this select")
         address = registers[0]
 
-        client = self.coordinator.hass.data[DOMAIN][self._entry_id]["client"]
+        client = self._client
+        snapshot = self._registers
         try:
-            # If a mask is defined, preserve other bits by reading current value first
+            # If a mask is defined, preserve other bits using the current value
             if self._definition.mask:
-                rr = await client.async_read_holding_registers(address, 1)
-                if rr.isError():
-                    raise HomeAssistantError(f"Failed to read before write: {rr}")
-                current = rr.registers[0]
+                cached = snapshot.get(address)
+                if cached is not None and (
+                    _time.monotonic() - cached[1] <= REGISTER_SNAPSHOT_MAX_AGE.total_seconds()
+                ):
+                    # Recently polled word; saves a Modbus round trip
+                    current = cached[0]
+                else:
+                    rr = await client.async_read_holding_registers(address, 1)
+                    if rr.isError():
+                        raise HomeAssistantError(f"Failed to read before write: {rr}")
+                    current = rr.registers[0]
                 masked = (current & ~self._definition.mask) | (value & self._definition.mask)
                 value_to_write = masked
             else:
                 value_to_write = value
 
+            # The polled word is stale once we write; re-cache it only after verification
+            snapshot.pop(address, None)
             await client.async_write_register(address, value_to_write)
-            _LOGGER.info(
-                "Wrote select %s (option=%s -> value=%s) to register %s (masked=%s)",
-                self.entity_description.key,
-                option,
-                value_to_write,
-                address,
-                self._definition.mask,
-            )
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(
+                    "Wrote select %s (option=%s -> value=%s) to register %s (masked=%s)",
+                    self._key,
+                    option,
+                    value_to_write,
+                    address,
+                    self._definition.mask,
+                )
 
             # Read-after-write verification
             try:
@@ -179,6 +204,7 @@ class DeyeDefinitionSelect(CoordinatorEntity, SelectEntity):
                             raise HomeAssistantError(
                                 f"Write verification failed: wrote {value_to_write} but read back {read_value}"
                             )
+                    snapshot[address] = (read_value, _time.monotonic())
                     _LOGGER.debug(
                         "Write verification OK for %s: option '%s' confirmed at register %s",
                         self.entity_description.key,
@@ -210,13 +236,19 @@ class DeyeDefinitionSelect(CoordinatorEntity, SelectEntity):
             )
             raise HomeAssistantError(f"Failed to write: {err}") from err
 
-        await self.coordinator.async_request_refresh()
+        # Reflect the selected option straight away, then confirm from the inverter
+        # in the background so the service call returns without waiting for a poll.
+        self.coordinator.data[self._key] = option
+        if self.hass is not None:  # None until added to a platform
+            self.async_write_ha_state()
+        self.coordinator.hass.async_create_task(self.coordinator.async_request_refresh())
 
 
 def _description_for(item: DefinitionItem) -> SelectEntityDescription | None:
     """Map definition item to a select description."""
     if not item.lookup:
         return None
+    # Unique labels in first-seen order
     options = list(dict.fromkeys(item.lookup.values()))
     return SelectEntityDescription(
         key=item.key,
@@ -224,3 +256,8 @@ def _description_for(item: DefinitionItem) -> SelectEntityDescription | None:
         icon=item.icon,
         options=options,
     )
+
+
+def _reverse_lookup(lookup: dict[int, Any]) -> dict[Any, int]:
+    """Map lookup labels back to raw values (last raw value wins on duplicates)."""
+    return {v: k for k, v in lookup.items()}
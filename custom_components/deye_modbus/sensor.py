@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 import re
 import logging
@@ -22,25 +23,43 @@ from homeassistant.const import (
     UnitOfFrequency,
     ATTR_ATTRIBUTION,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
-from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import DOMAIN
 from .definition_loader import DefinitionItem
-from .device_info import build_base_device, build_device_for_group
+from .device_info import build_base_device, group_device_builder
+from .entity import DeyeChangeOnlyEntity
 
 _LOGGER = logging.getLogger(__name__)
 
-_NUMERIC_DEVICE_CLASSES = {
+_NUMERIC_DEVICE_CLASSES: frozenset[SensorDeviceClass] = frozenset({
     SensorDeviceClass.POWER,
     SensorDeviceClass.ENERGY,
     SensorDeviceClass.VOLTAGE,
     SensorDeviceClass.CURRENT,
     SensorDeviceClass.FREQUENCY,
     SensorDeviceClass.TEMPERATURE,
+})
+
+# Case-folded definition units mapped to (native unit, device class, state class)
+_UNIT_MAP: dict[str, tuple[str, SensorDeviceClass, SensorStateClass]] = {
+    "w": (UnitOfPower.WATT, SensorDeviceClass.POWER, SensorStateClass.MEASUREMENT),
+    "v": (UnitOfElectricPotential.VOLT, SensorDeviceClass.VOLTAGE, SensorStateClass.MEASUREMENT),
+    "a": (UnitOfElectricCurrent.AMPERE, SensorDeviceClass.CURRENT, SensorStateClass.MEASUREMENT),
+    "hz": (UnitOfFrequency.HERTZ, SensorDeviceClass.FREQUENCY, SensorStateClass.MEASUREMENT),
+    "kwh": (UnitOfEnergy.KILO_WATT_HOUR, SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING),
+    "c": (UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT),
+    "°c": (UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT),
 }
+_NO_UNIT_MAPPING: tuple[None, None, None] = (None, None, None)
+
+_NUMERIC_RE = re.compile(r"[-+]?\d*\.?\d+")
+
+# Static attributes shared by every meta sensor; HA copies them into the state
+_META_ATTRS: dict[str, Any] = {ATTR_ATTRIBUTION: "Deye Modbus"}
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -52,55 +71,82 @@ async def async_setup_entry(
 
     coordinator = sol["coordinator"]
     meta = hass.data[DOMAIN][entry.entry_id].get("meta", {})
-    items: list[DefinitionItem] = sol["items"]
+    items: list[DefinitionItem] = sol["items_by_platform"].get("sensor", [])
 
     base_device_info = build_base_device(entry.entry_id, entry.data)
-    entities: list[CoordinatorEntity] = []
+    device_for = group_device_builder(entry.entry_id, base_device_info)
+
+    def _sensors_for(sensor_items: list[DefinitionItem]):
+        return (
+            DeyeDefinitionSensor(
+                coordinator=coordinator,
+                description=desc,
+                entry_id=entry.entry_id,
+                device_info=device_for(item),
+            )
+            for item in sensor_items
+            if (desc := _description_for(item)) is not None
+        )
+
+    # Only create sensors the inverter actually reports; the rest wait for their first value
+    data = coordinator.data or {}
+    pending: dict[str, DefinitionItem] = {}
+    present: list[DefinitionItem] = []
+    for item in items:
+        if item.key in data:
+            present.append(item)
+        else:
+            pending[item.key] = item
 
     # Meta sensors on the base inverter device
-    entities.append(
+    entities: list[CoordinatorEntity] = [
         DeyeMetaSensor(
             coordinator=coordinator,
             entry_id=entry.entry_id,
             device_info=base_device_info,
             key="last_success",
             name="Last Successful Poll",
-        )
-    )
-    entities.append(
+        ),
         DeyeMetaSensor(
             coordinator=coordinator,
             entry_id=entry.entry_id,
             device_info=base_device_info,
             key="last_error",
             name="Last Poll Error",
-        )
-    )
+        ),
+    ]
+    entities.extend(_sensors_for(present))
 
-    for item in items:
-        if item.platform != "sensor":
-            continue
+    # The coordinator has already refreshed; don't poll per entity on add
+    async_add_entities(entities, update_before_add=False)
 
-        desc = _description_for(item)
-        if not desc:
-            continue
+    if not pending:
+        return
 
-        entities.append(
-            DeyeDefinitionSensor(
-                coordinator=coordinator,
-                description=desc,
-                entry_id=entry.entry_id,
-                device_info=build_device_for_group(item, entry.entry_id, base_device_info),
-            )
-        )
+    _LOGGER.debug(
+        "Deferring %s definition sensor(s) with no value after the first poll: %s",
+        len(pending),
+        ", ".join(pending),
+    )
+
+    @callback
+    def _async_add_new_keys() -> None:
+        """Add sensors for keys that appeared since setup."""
+        if not pending:
+            return
+        new_data = coordinator.data or {}
+        new_items = [pending.pop(key) for key in [k for k in pending if k in new_data]]
+        if new_items:
+            async_add_entities(_sensors_for(new_items), update_before_add=False)
 
-    if entities:
-        async_add_entities(entities)
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_keys))
 
 
 class DeyeMetaSensor(CoordinatorEntity, SensorEntity):
     """Sensor exposing meta information such as last poll timestamps and errors."""
 
+    __slots__ = ("_key", "_entry_id", "_meta")
+
     _attr_has_entity_name = True
 
     def __init__(
@@ -114,6 +160,8 @@ class DeyeMetaSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self._key = key
         self._entry_id = entry_id
+        # Same dict the coordinator mutates in place on every poll
+        self._meta: dict[str, Any] = coordinator.hass.data[DOMAIN][entry_id].setdefault("meta", {})
         self._attr_unique_id = f"{entry_id}_meta_{key}"
         self._attr_device_info = device_info
         self._attr_name = name
@@ -122,17 +170,18 @@ class DeyeMetaSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def native_value(self):
-        meta = self.coordinator.hass.data[DOMAIN].get(self._entry_id, {}).get("meta", {})
-        return meta.get(self._key)
+        return self._meta.get(self._key)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
-        return {ATTR_ATTRIBUTION: "Deye Modbus"}
+        return _META_ATTRS
 
 
-class DeyeDefinitionSensor(CoordinatorEntity, SensorEntity):
+class DeyeDefinitionSensor(DeyeChangeOnlyEntity, SensorEntity):
     """Sensor entity driven by external definition."""
 
+    __slots__ = ("_is_numeric",)
+
     _attr_has_entity_name = True
 
     def __init__(
@@ -142,17 +191,27 @@ class DeyeDefinitionSensor(CoordinatorEntity, SensorEntity):
         entry_id: str,
         device_info: dict[str, Any],
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.key)
         self.entity_description = description
+        self._is_numeric = description.device_class in _NUMERIC_DEVICE_CLASSES
         self._attr_unique_id = f"{entry_id}_def_{description.key}"
         self._attr_device_info = device_info
 
     @property
     def native_value(self):
-        val = self.coordinator.data.get(self.entity_description.key)
-        if isinstance(val, str) and self.entity_description.device_class in _NUMERIC_DEVICE_CLASSES:
+        data = self.coordinator.data
+        if not data:
+            return None
+        val = data.get(self._key)
+        if self._is_numeric and type(val) is str:
+            # Plain numbers and "<number> <unit>" skip the search. fullmatch keeps the result
+            # identical to the search below; float() alone also accepts "1e3", "1_0" and "nan".
+            head = val.partition(" ")[0]
+            if _NUMERIC_RE.fullmatch(head):
+                num = float(head)
+                return int(num) if num.is_integer() else num
             # Try to extract a numeric component from strings like "50 Hz"
-            match = re.search(r"[-+]?\d*\.?\d+", val)
+            match = _NUMERIC_RE.search(val)
             if match:
                 try:
                     num = float(match.group(0))
@@ -172,44 +231,25 @@ class DeyeDefinitionSensor(CoordinatorEntity, SensorEntity):
 
 def _description_for(item: DefinitionItem) -> SensorEntityDescription | None:
     """Map definition item to a sensor description (read-only)."""
-    unit = item.unit
-    dev_class = None
-    state_class = None
-    native_unit = None
-
-    if unit in ("W", "w"):
-        native_unit = UnitOfPower.WATT
-        dev_class = SensorDeviceClass.POWER
-        state_class = SensorStateClass.MEASUREMENT
-    elif unit in ("V", "v"):
-        native_unit = UnitOfElectricPotential.VOLT
-        dev_class = SensorDeviceClass.VOLTAGE
-        state_class = SensorStateClass.MEASUREMENT
-    elif unit in ("A", "a"):
-        native_unit = UnitOfElectricCurrent.AMPERE
-        dev_class = SensorDeviceClass.CURRENT
-        state_class = SensorStateClass.MEASUREMENT
-    elif unit in ("Hz", "hz"):
-        native_unit = UnitOfFrequency.HERTZ
-        dev_class = SensorDeviceClass.FREQUENCY
-        state_class = SensorStateClass.MEASUREMENT
-    elif unit in ("kWh", "kwh"):
-        native_unit = UnitOfEnergy.KILO_WATT_HOUR
-        dev_class = SensorDeviceClass.ENERGY
-        state_class = SensorStateClass.TOTAL_INCREASING
-    elif unit in ("C", "°C", "c"):
-        native_unit = UnitOfTemperature.CELSIUS
-        dev_class = SensorDeviceClass.TEMPERATURE
-        state_class = SensorStateClass.MEASUREMENT
+    return _build_description(item.key, item.name, item.unit, item.icon)
+
+
+@lru_cache(maxsize=512)
+def _build_description(
+    key: str, name: str, unit: str | None, icon: str | None
+) -> SensorEntityDescription:
+    """Build a sensor description; cached so reloads and multiple entries share it."""
+    unit_key = unit.casefold() if unit else None
+    native_unit, dev_class, state_class = _UNIT_MAP.get(unit_key, _NO_UNIT_MAPPING)
 
     # Fall back to the raw unit from definitions when we don't have a native mapping
     fallback_unit = native_unit or unit
 
     return SensorEntityDescription(
-        key=item.key,
-        name=item.name,
+        key=key,
+        name=name,
         native_unit_of_measurement=fallback_unit,
         device_class=dev_class,
         state_class=state_class,
-        icon=item.icon,
+        icon=icon,
     )
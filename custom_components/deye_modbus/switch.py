@@ -9,11 +9,15 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN
 from .definition_loader import DefinitionItem
-from .device_info import build_base_device, build_device_for_group
+from .device_info import build_base_device, group_device_builder
+from .entity import DeyeChangeOnlyEntity
+
+# String states treated as "on" (compared lower-cased)
+_TRUTHY: frozenset[str] = frozenset({"on", "true", "1"})
 
 
 async def async_setup_entry(
@@ -25,14 +29,13 @@ async def async_setup_entry(
         return
 
     coordinator = defs["coordinator"]
-    items: list[DefinitionItem] = defs["items"]
+    items: list[DefinitionItem] = defs["items_by_platform"].get("switch", [])
 
     base_device_info = build_base_device(entry.entry_id, entry.data)
+    device_for = group_device_builder(entry.entry_id, base_device_info)
 
     entities: list[DeyeDefinitionSwitch] = []
     for item in items:
-        if item.platform != "switch":
-            continue
         desc = SwitchEntityDescription(
             key=item.key,
             name=item.name,
@@ -44,7 +47,7 @@ async def async_setup_entry(
                 coordinator=coordinator,
                 description=desc,
                 entry_id=entry.entry_id,
-                device_info=build_device_for_group(item, entry.entry_id, base_device_info),
+                device_info=device_for(item),
             )
         )
 
@@ -52,9 +55,11 @@ async def async_setup_entry(
         async_add_entities(entities)
 
 
-class DeyeDefinitionSwitch(CoordinatorEntity, SwitchEntity):
+class DeyeDefinitionSwitch(DeyeChangeOnlyEntity, SwitchEntity):
     """Switch entity driven by external definition (read-only)."""
 
+    __slots__ = ()
+
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
 
@@ -65,18 +70,24 @@ class DeyeDefinitionSwitch(CoordinatorEntity, SwitchEntity):
         entry_id: str,
         device_info: dict[str, Any],
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.key)
         self.entity_description = description
         self._attr_unique_id = f"{entry_id}_def_switch_{description.key}"
         self._attr_device_info = device_info
 
     @property
     def is_on(self) -> bool | None:
-        val = self.coordinator.data.get(self.entity_description.key)
+        val = self.coordinator.data.get(self._key)
         if val is None:
             return None
-        if isinstance(val, str):
-            return val.lower() in ("on", "true", "1")
+        # Decoded switch values are almost always plain ints; test exact types first
+        cls = val.__class__
+        if cls is int:
+            return val != 0
+        if cls is bool:
+            return val
+        if cls is str:
+            return val.lower() in _TRUTHY
         try:
             return bool(int(val))
         except Exception:
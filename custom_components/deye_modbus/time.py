@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 from typing import Any
 import logging
@@ -16,19 +17,25 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpda
 
 from .const import DOMAIN
 from .definition_loader import DefinitionItem
-from .device_info import build_base_device, build_device_for_group
+from .device_info import build_base_device, group_device_builder
 
 _LOGGER = logging.getLogger(__name__)
 
 # Keys allowed to perform writes (ToU program times)
-_WRITABLE_TIME_KEYS = {
+_WRITABLE_TIME_KEYS: frozenset[str] = frozenset({
     "program_1_time",
     "program_2_time",
     "program_3_time",
     "program_4_time",
     "program_5_time",
     "program_6_time",
-}
+})
+
+# Time writes arriving within this window are coalesced into FC16 runs
+_WRITE_BATCH_WINDOW = 0.05
+
+# Marks "no attributes built yet" for the per-entity attribute cache
+_UNSET: Any = object()
 
 
 async def async_setup_entry(
@@ -40,40 +47,175 @@ async def async_setup_entry(
         return
 
     coordinator = defs["coordinator"]
-    items: list[DefinitionItem] = defs["items"]
+    items: list[DefinitionItem] = defs["items_by_platform"].get("time", [])
 
     base_device_info = build_base_device(entry.entry_id, entry.data)
+    device_for = group_device_builder(entry.entry_id, base_device_info)
+    batcher = _TimeWriteBatcher(hass, hass.data[DOMAIN][entry.entry_id]["client"], coordinator)
+    entry.async_on_unload(batcher.async_cancel)
 
-    entities: list[DeyeDefinitionTime] = []
-    for item in items:
-        if item.platform != "time":
-            continue
-        desc = TimeEntityDescription(
-            key=item.key,
-            name=item.name,
-            icon=item.icon,
-            entity_category=EntityCategory.CONFIG,
+    async_add_entities(
+        DeyeDefinitionTime(
+            coordinator=coordinator,
+            description=TimeEntityDescription(
+                key=item.key,
+                name=item.name,
+                icon=item.icon,
+                entity_category=EntityCategory.CONFIG,
+            ),
+            entry_id=entry.entry_id,
+            definition=item,
+            device_info=device_for(item),
+            batcher=batcher,
         )
-        entities.append(
-            DeyeDefinitionTime(
-                coordinator=coordinator,
-                description=desc,
-                entry_id=entry.entry_id,
-                definition=item,
-                device_info=build_device_for_group(item, entry.entry_id, base_device_info),
+        for item in items
+    )
+
+
+class _WriteSuperseded(Exception):
+    """A queued time write was replaced by a later write to the same register."""
+
+
+class _TimeWriteBatcher:
+    """Coalesce time writes issued close together into multi-register writes."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: Any,
+        coordinator: DataUpdateCoordinator[dict[str, Any]],
+    ) -> None:
+        self._hass = hass
+        self._client = client
+        self._coordinator = coordinator
+        # address -> (raw value, future) of every caller waiting on that address, oldest first
+        self._pending: dict[int, list[tuple[int, asyncio.Future[int | None]]]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+
+    async def async_write(self, address: int, raw: int) -> int | None:
+        """Queue a register write and wait until the batch containing it is sent.
+
+        Returns the value read back from the register after the write, or None
+        if the read-back failed (already logged). Raises _WriteSuperseded if a
+        later call queued a different value for the same register.
+        """
+        future: asyncio.Future[int | None] = self._hass.loop.create_future()
+        # Last value wins for repeated writes to the same register
+        self._pending.setdefault(address, []).append((raw, future))
+        if self._timer is None:
+            self._timer = self._hass.loop.call_later(_WRITE_BATCH_WINDOW, self._schedule_flush)
+        return await future
+
+    def async_cancel(self) -> None:
+        """Drop queued writes when the entry unloads."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, {}
+        for waiters in pending.values():
+            for _raw, future in waiters:
+                if not future.done():
+                    future.set_exception(HomeAssistantError("Integration unloaded before write"))
+
+    def _schedule_flush(self) -> None:
+        self._timer = None
+        self._hass.async_create_task(self._async_flush())
+
+    async def _async_flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        written = False
+        for start, values, waiters in _contiguous_runs(pending):
+            try:
+                if len(values) == 1:
+                    await self._client.async_write_register(start, values[0])
+                else:
+                    await self._client.async_write_registers(start, values)
+            except Exception as err:  # noqa: BLE001
+                for _address, _raw, future in waiters:
+                    if not future.done():
+                        future.set_exception(err)
+                continue
+            written = True
+            _LOGGER.debug("Wrote %s time register(s) starting at %s: %s", len(values), start, values)
+            # One read verifies the whole run; each caller compares its own register
+            read_back = await self._async_read_back(start, len(values))
+            for address, raw, future in waiters:
+                if future.done():
+                    continue
+                if raw != values[address - start]:
+                    # A later caller's value went out instead; nothing to verify for this one
+                    future.set_exception(_WriteSuperseded())
+                else:
+                    future.set_result(read_back[address - start] if read_back else None)
+
+        # One confirming refresh for the whole batch rather than one per entity
+        if written:
+            self._hass.async_create_task(self._coordinator.async_request_refresh())
+
+    async def _async_read_back(self, start: int, count: int) -> list[int] | None:
+        """Read a written run back in one request; None if it cannot be verified."""
+        try:
+            read_result = await self._client.async_read_holding_registers(start, count)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.warning(
+                "Exception during write verification for time registers %s-%s: %s",
+                start,
+                start + count - 1,
+                err,
             )
-        )
+            return None
+        # A short response would leave waiters unresolved; treat it like a failed read
+        if read_result.isError() or len(read_result.registers) < count:
+            _LOGGER.warning(
+                "Failed to verify write for time registers %s-%s: %s",
+                start,
+                start + count - 1,
+                read_result,
+            )
+            return None
+        return read_result.registers
+
+
+def _contiguous_runs(
+    pending: dict[int, list[tuple[int, asyncio.Future[int | None]]]],
+) -> list[tuple[int, list[int], list[tuple[int, int, asyncio.Future[int | None]]]]]:
+    """Group queued writes into (start, values, (address, raw, waiter)) runs of consecutive addresses.
 
-    if entities:
-        async_add_entities(entities)
+    Each register is written with the value of its most recent caller.
+    """
+    runs: list[tuple[int, list[int], list[tuple[int, int, asyncio.Future[int | None]]]]] = []
+    for address in sorted(pending):
+        waiters = [(address, raw, future) for raw, future in pending[address]]
+        raw = waiters[-1][1]
+        if runs and address == runs[-1][0] + len(runs[-1][1]):
+            runs[-1][1].append(raw)
+            runs[-1][2].extend(waiters)
+        else:
+            runs.append((address, [raw], waiters))
+    return runs
 
 
 class DeyeDefinitionTime(CoordinatorEntity, TimeEntity):
     """Time entity driven by external definition (read-only)."""
 
+    __slots__ = (
+        "_entry_id",
+        "_definition",
+        "_batcher",
+        "_writable",
+        "_client",
+        "_address",
+        "_writes_in_flight",
+        "_attrs_value",
+        "_attrs",
+    )
+
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
 
+    # Set True to send each write immediately instead of coalescing with its neighbours
+    write_no_delay: bool = False
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator[dict[str, Any]],
@@ -81,6 +223,7 @@ class DeyeDefinitionTime(CoordinatorEntity, TimeEntity):
         entry_id: str,
         definition: DefinitionItem,
         device_info: dict[str, Any],
+        batcher: _TimeWriteBatcher | None = None,
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
@@ -88,38 +231,87 @@ class DeyeDefinitionTime(CoordinatorEntity, TimeEntity):
         self._attr_device_info = device_info
         self._entry_id = entry_id
         self._definition = definition
+        self._batcher = batcher
+        self._writable = description.key in _WRITABLE_TIME_KEYS
+        # The client lives for the whole config entry; platforms are set up after it is stored
+        self._client = coordinator.hass.data[DOMAIN][entry_id]["client"]
+        registers = definition.registers
+        self._address = registers[0] if registers else None
+        self._writes_in_flight = 0
+        self._attrs_value: Any = _UNSET
+        self._attrs: dict[str, Any] | None = None
 
     @property
     def native_value(self) -> datetime.time | None:
         val = self.coordinator.data.get(self.entity_description.key)
-        if isinstance(val, datetime.time):
-            return val
-        return None
+        # The coordinator only ever stores plain datetime.time values, never subclasses
+        return val if type(val) is datetime.time else None
 
-    async def async_set_value(self, value: datetime.time) -> None:
-        if self.entity_description.key not in _WRITABLE_TIME_KEYS:
+    async def async_set_value(self, value: datetime.time, *, force: bool = False) -> None:
+        """Write the time; ``force`` rewrites even if the last poll already matches."""
+        if not self._writable:
             raise HomeAssistantError("Writes not implemented for this entity")
 
-        registers = self._definition.registers
-        if not registers:
+        address = self._address
+        if address is None:
             raise HomeAssistantError("No register defined for this time")
-        address = registers[0]
 
+        # HA's time service validates the input, so value is always a datetime.time
+        raw = value.hour * 100 + value.minute
+
+        # Skip the write and its verification read when the last poll already holds this time.
+        # An earlier write may still be queued or in flight and would overwrite the poll, so
+        # never skip while one is outstanding.
+        current = self.coordinator.data.get(self.entity_description.key)
+        if (
+            not force
+            and not self._writes_in_flight
+            and isinstance(current, datetime.time)
+            and current.hour == value.hour
+            and current.minute == value.minute
+        ):
+            _LOGGER.debug(
+                "Time %s already at %s (register %s); skipping write",
+                self.entity_description.key,
+                value,
+                address,
+            )
+            return
+
+        self._writes_in_flight += 1
         try:
-            raw = value.hour * 100 + value.minute
-        except Exception as err:  # noqa: BLE001
-            raise HomeAssistantError(f"Invalid time value: {value}") from err
+            await self._async_write_verified(address, raw, value)
+        finally:
+            self._writes_in_flight -= 1
 
-        client = self.coordinator.hass.data[DOMAIN][self._entry_id]["client"]
+    async def _async_write_verified(self, address: int, raw: int, value: datetime.time) -> None:
+        """Write ``raw`` to ``address``, verify it and reflect it in the coordinator data."""
+        client = self._client
+        batched = self._batcher is not None and not self.write_no_delay
+        read_back: int | None = None
         try:
-            await client.async_write_register(address, raw)
-            _LOGGER.info(
-                "Wrote time %s (value=%s -> raw=%s) to register %s",
+            if batched:
+                # The batcher reads the whole run back once; None means it could not verify
+                read_back = await self._batcher.async_write(address, raw)
+            else:
+                await client.async_write_register(address, raw)
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(
+                    "Wrote time %s (value=%s -> raw=%s) to register %s",
+                    self.entity_description.key,
+                    value,
+                    raw,
+                    address,
+                )
+        except _WriteSuperseded:
+            # The later value is what the register holds; that caller verifies and updates state
+            _LOGGER.debug(
+                "Time %s write of %s to register %s superseded by a later write",
                 self.entity_description.key,
                 value,
-                raw,
                 address,
             )
+            return
         except Exception as err:  # noqa: BLE001
             _LOGGER.error(
                 "Failed to write time %s (value=%s -> raw=%s) to register %s: %s",
@@ -133,16 +325,21 @@ class DeyeDefinitionTime(CoordinatorEntity, TimeEntity):
 
         # Read-after-write verification
         try:
-            read_result = await client.async_read_holding_registers(address, 1)
-            if read_result.isError():
-                _LOGGER.warning(
-                    "Failed to verify write for %s at register %s: %s",
-                    self.entity_description.key,
-                    address,
-                    read_result,
-                )
+            if batched:
+                read_value = read_back
             else:
-                read_value = read_result.registers[0]
+                read_result = await client.async_read_holding_registers(address, 1)
+                if read_result.isError():
+                    _LOGGER.warning(
+                        "Failed to verify write for %s at register %s: %s",
+                        self.entity_description.key,
+                        address,
+                        read_result,
+                    )
+                    read_value = None
+                else:
+                    read_value = read_result.registers[0]
+            if read_value is not None:
                 if read_value != raw:
                     _LOGGER.error(
                         "Write verification FAILED for %s: wrote %s (%s) but read back %s (register %s)",
@@ -173,11 +370,23 @@ class DeyeDefinitionTime(CoordinatorEntity, TimeEntity):
                 verify_err,
             )
 
-        await self.coordinator.async_request_refresh()
+        # Reflect the written time straight away (the register holds no seconds), then
+        # confirm from the inverter in the background so the service call returns now.
+        self.coordinator.data[self.entity_description.key] = datetime.time(value.hour, value.minute)
+        if self.hass is not None:  # None until added to a platform
+            self.async_write_ha_state()
+        if not batched:
+            # The batcher already requested one refresh for the whole flush
+            self.coordinator.hass.async_create_task(self.coordinator.async_request_refresh())
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
-        return {
-            "value": self.native_value,
-            "device_class": "time",
-        }
+        # Rebuild only when the time changes; most polls leave program times untouched
+        value = self.native_value
+        if value != self._attrs_value:
+            self._attrs_value = value
+            self._attrs = {
+                "value": value,
+                "device_class": "time",
+            }
+        return self._attrs
@@ -1,32 +1,54 @@
 """Pytest configuration and fixtures for Deye Modbus tests."""
 
+from __future__ import annotations
+
+from typing import Any
+
 import pytest
 import sys
 from pathlib import Path
 
-# Add custom_components to path for imports
-repo_root = Path(__file__).parent.parent
-sys.path.insert(0, str(repo_root))
+# Add custom_components to path for imports (once, even if conftest is imported again)
+repo_root = str(Path(__file__).parent.parent)
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
 
+from tests.fakes import FakeClient, FakeCoordinator, make_definition  # noqa: E402
 
-@pytest.fixture
-def mock_coordinator():
-    """Create a mock coordinator for testing."""
-    from unittest.mock import Mock, AsyncMock
 
-    coordinator = Mock()
-    coordinator.data = {}
-    coordinator.async_request_refresh = AsyncMock()
-    coordinator.hass = Mock()
-    return coordinator
+@pytest.fixture
+def fake_client():
+    """Create a Modbus client fake with no queued reads."""
+    return FakeClient()
 
 
 @pytest.fixture
-def mock_modbus_client():
-    """Create a mock Modbus client for testing."""
-    from unittest.mock import AsyncMock, Mock
-
-    client = AsyncMock()
-    client.async_write_register = AsyncMock()
-    client.async_read_holding_registers = AsyncMock()
-    return client
+def fake_coordinator(fake_client):
+    """Create a coordinator fake wired to ``fake_client`` under ``ENTRY_ID``."""
+    return FakeCoordinator(fake_client)
+
+
+@pytest.fixture(scope="module")
+def number_entity_factory():
+    """Return a builder for (DefinitionItem, NumberEntityDescription) pairs.
+
+    Defaults describe a plain 0-100 number on register 0x0100; pass keyword
+    overrides for the fields a test exercises.
+    """
+    from homeassistant.components.number import NumberEntityDescription
+
+    def make(**overrides: Any):
+        definition = make_definition(**{
+            "key": "test_number",
+            "name": "Test Number",
+            "platform": "number",
+            "registers": [0x0100],
+            "scale": 1,
+            "range_min": 0,
+            "range_max": 100,
+            **overrides,
+        })
+        description = NumberEntityDescription(key=definition.key, name=definition.name)
+        return definition, description
+
+    return make
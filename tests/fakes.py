@@ -0,0 +1,113 @@
+"""Lightweight fakes for the Modbus client, coordinator and definitions used in tests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+from custom_components.deye_modbus.definition_loader import DefinitionItem
+
+ENTRY_ID = "test_entry"
+
+# Fields DefinitionItem requires that most tests don't care about
+_DEFINITION_DEFAULTS: dict[str, Any] = {
+    "scale": None,
+    "lookup": None,
+    "group": "",
+    "icon": None,
+    "unit": None,
+    "rule": None,
+}
+
+
+def make_definition(**fields: Any) -> DefinitionItem:
+    """Build a DefinitionItem, filling required fields the test doesn't set."""
+    return DefinitionItem(**{**_DEFINITION_DEFAULTS, **fields})
+
+
+class FakeReadResult:
+    """Stand-in for a pymodbus read response."""
+
+    __slots__ = ("registers", "_err")
+
+    def __init__(self, registers: list[int], err: bool = False) -> None:
+        self.registers = registers
+        self._err = err
+
+    def isError(self) -> bool:
+        return self._err
+
+
+class FakeClient:
+    """Modbus client fake that records writes and replays queued reads."""
+
+    def __init__(self, *reads: FakeReadResult, error: Exception | None = None) -> None:
+        self.calls: list[tuple[int, Any]] = []
+        self.reads: list[tuple[int, int]] = []
+        self._next_read = list(reads)
+        self._error = error
+
+    async def async_write_register(self, address: int, value: int) -> None:
+        # Yield like a real round-trip so concurrent callers can interleave
+        await asyncio.sleep(0)
+        if self._error is not None:
+            raise self._error
+        self.calls.append((address, value))
+
+    async def async_write_registers(self, address: int, values: list[int]) -> None:
+        await asyncio.sleep(0)
+        if self._error is not None:
+            raise self._error
+        self.calls.append((address, list(values)))
+
+    async def async_read_holding_registers(self, address: int, count: int) -> FakeReadResult:
+        self.reads.append((address, count))
+        return self._next_read.pop(0)
+
+
+class FakeHass:
+    """Just enough of HomeAssistant for entities and the time write batcher."""
+
+    def __init__(self, entry_data: dict[str, Any]) -> None:
+        self.data = {"deye_modbus": {ENTRY_ID: entry_data}}
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    def async_create_task(self, coro):
+        return self.loop.create_task(coro)
+
+
+class FakeCoordinator:
+    """Coordinator fake holding polled data and counting refresh requests."""
+
+    last_update_success = True
+
+    def __init__(self, client: FakeClient, data: dict[str, Any] | None = None, **entry_data: Any) -> None:
+        self.data = {} if data is None else data
+        self.hass = FakeHass({"client": client, **entry_data})
+        self.refresh_requests = 0
+        self.listeners: list[Callable[[], None]] = []
+
+    def async_request_refresh(self):
+        self.refresh_requests += 1
+        return asyncio.sleep(0)
+
+    def async_add_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
+        self.listeners.append(update_callback)
+        return lambda: self.listeners.remove(update_callback)
+
+
+class FakeConfigEntry:
+    """Config entry fake that records the callbacks registered for unload."""
+
+    entry_id = ENTRY_ID
+
+    def __init__(self, data: dict[str, Any] | None = None) -> None:
+        self.data = {} if data is None else data
+        self.unload_callbacks: list[Callable[[], None]] = []
+
+    def async_on_unload(self, func: Callable[[], None]) -> None:
+        self.unload_callbacks.append(func)
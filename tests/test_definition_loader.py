@@ -0,0 +1,51 @@
+"""Tests for loading definition files."""
+
+from custom_components.deye_modbus.definition_loader import load_definition
+
+_DEFINITION = """
+parameters:
+  - group: Load
+    items:
+      - name: Load Frequency
+        platform: sensor
+        rule: 1
+        registers: [0x00C0]
+  - group: Diagnostics
+    items:
+      - name: Load Frequency
+        platform: sensor
+        rule: 1
+        registers: [0x00C4]
+      - name: Load Frequency
+        platform: number
+        rule: 1
+        registers: [0x00C4]
+"""
+
+
+class TestDuplicateItems:
+    """Test handling of items that repeat a key."""
+
+    def test_duplicate_platform_and_key_dropped(self, tmp_path):
+        """Test that a later item with an already-loaded platform and key is skipped."""
+        def_path = tmp_path / "deye.yaml"
+        def_path.write_text(_DEFINITION)
+
+        items = load_definition(def_path)
+
+        sensors = [item for item in items if item.platform == "sensor"]
+        assert [(item.key, item.registers, item.group) for item in sensors] == [
+            ("load_frequency", [0x00C0], "Load")
+        ]
+
+    def test_same_key_on_other_platform_kept(self, tmp_path):
+        """Test that the same key on a different platform is still loaded."""
+        def_path = tmp_path / "deye.yaml"
+        def_path.write_text(_DEFINITION)
+
+        items = load_definition(def_path)
+
+        assert [(item.platform, item.key) for item in items] == [
+            ("sensor", "load_frequency"),
+            ("number", "load_frequency"),
+        ]
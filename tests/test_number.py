@@ -1,11 +1,23 @@
 """Tests for number entity write operations and validation."""
 
+import asyncio
+
 import pytest
-from unittest.mock import Mock, AsyncMock, patch
 from homeassistant.exceptions import HomeAssistantError
 
 from custom_components.deye_modbus.number import DeyeDefinitionNumber
-from custom_components.deye_modbus.definition_loader import DefinitionItem
+
+from tests.fakes import FakeClient, FakeCoordinator, FakeReadResult
+
+
+def _entity(coordinator, definition, description):
+    return DeyeDefinitionNumber(
+        coordinator=coordinator,
+        description=description,
+        entry_id="test_entry",
+        definition=definition,
+        device_info={},
+    )
 
 
 class TestNumberValidation:
@@ -13,288 +25,117 @@ class TestNumberValidation:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.coordinator = Mock()
-        self.coordinator.data = {}
-        self.coordinator.hass = Mock()
-        self.coordinator.hass.data = {
-            "deye_modbus": {
-                "test_entry": {
-                    "client": AsyncMock()
-                }
-            }
-        }
-
-    def test_to_raw_basic_scaling(self):
-        """Test basic scale conversion."""
-        definition = DefinitionItem(
-            key="test_number",
-            name="Test Number",
-            platform="number",
-            registers=[0x0100],
-            scale=0.1,
-            range_min=0,
-            range_max=100,
-        )
-
-        from homeassistant.components.number import NumberEntityDescription
-        desc = NumberEntityDescription(key="test_number", name="Test Number")
-
-        entity = DeyeDefinitionNumber(
-            coordinator=self.coordinator,
-            description=desc,
-            entry_id="test_entry",
-            definition=definition,
-            device_info={},
-        )
-
-        # Test: value 10.5 with scale 0.1 should become 105
-        result = entity._to_raw(10.5)
-        assert result == 105
-
-    def test_to_raw_list_scaling(self):
-        """Test list-based scale conversion."""
-        definition = DefinitionItem(
-            key="test_number",
-            name="Test Number",
-            platform="number",
-            registers=[0x0100],
-            scale=[1, 10],  # Factor of 0.1
-            range_min=0,
-            range_max=100,
-        )
-
-        from homeassistant.components.number import NumberEntityDescription
-        desc = NumberEntityDescription(key="test_number", name="Test Number")
-
-        entity = DeyeDefinitionNumber(
-            coordinator=self.coordinator,
-            description=desc,
-            entry_id="test_entry",
-            definition=definition,
-            device_info={},
-        )
-
-        # Test: value 10 with scale [1,10] should become 100
-        result = entity._to_raw(10.0)
-        assert result == 100
-
-    def test_to_raw_range_validation_min(self):
-        """Test that values below minimum are rejected."""
-        definition = DefinitionItem(
-            key="test_number",
-            name="Test Number",
-            platform="number",
-            registers=[0x0100],
-            scale=1,
-            range_min=10,
-            range_max=100,
-        )
-
-        from homeassistant.components.number import NumberEntityDescription
-        desc = NumberEntityDescription(key="test_number", name="Test Number")
-
-        entity = DeyeDefinitionNumber(
-            coordinator=self.coordinator,
-            description=desc,
-            entry_id="test_entry",
-            definition=definition,
-            device_info={},
-        )
-
-        # Test: value below minimum should raise error
-        with pytest.raises(HomeAssistantError, match="below minimum"):
-            entity._to_raw(5)
-
-    def test_to_raw_range_validation_max(self):
-        """Test that values above maximum are rejected."""
-        definition = DefinitionItem(
-            key="test_number",
-            name="Test Number",
-            platform="number",
-            registers=[0x0100],
-            scale=1,
-            range_min=0,
-            range_max=100,
-        )
-
-        from homeassistant.components.number import NumberEntityDescription
-        desc = NumberEntityDescription(key="test_number", name="Test Number")
-
-        entity = DeyeDefinitionNumber(
-            coordinator=self.coordinator,
-            description=desc,
-            entry_id="test_entry",
-            definition=definition,
-            device_info={},
-        )
-
-        # Test: value above maximum should raise error
-        with pytest.raises(HomeAssistantError, match="above maximum"):
-            entity._to_raw(150)
-
-    def test_to_raw_register_bounds_check(self):
-        """Test that converted values fit in 16-bit register."""
-        definition = DefinitionItem(
-            key="test_number",
-            name="Test Number",
-            platform="number",
-            registers=[0x0100],
-            scale=0.001,  # Will cause very large raw values
-            range_min=0,
-            range_max=100000,
-        )
-
-        from homeassistant.components.number import NumberEntityDescription
-        desc = NumberEntityDescription(key="test_number", name="Test Number")
-
-        entity = DeyeDefinitionNumber(
-            coordinator=self.coordinator,
-            description=desc,
-            entry_id="test_entry",
-            definition=definition,
-            device_info={},
-        )
-
-        # Test: value that converts to >65535 should raise error
-        with pytest.raises(HomeAssistantError, match="out of valid register range"):
-            entity._to_raw(100000)
-
-    def test_to_raw_invalid_value(self):
-        """Test that non-numeric values are rejected."""
-        definition = DefinitionItem(
-            key="test_number",
-            name="Test Number",
-            platform="number",
-            registers=[0x0100],
-            scale=1,
-            range_min=0,
-            range_max=100,
-        )
-
-        from homeassistant.components.number import NumberEntityDescription
-        desc = NumberEntityDescription(key="test_number", name="Test Number")
-
-        entity = DeyeDefinitionNumber(
-            coordinator=self.coordinator,
-            description=desc,
-            entry_id="test_entry",
-            definition=definition,
-            device_info={},
-        )
-
-        # Test: invalid value should raise error
-        with pytest.raises(HomeAssistantError, match="Invalid number value"):
-            entity._to_raw("not a number")
+        self.coordinator = FakeCoordinator(FakeClient())
+
+    @pytest.mark.parametrize(
+        ("scale", "range_min", "range_max", "value", "expected"),
+        [
+            # Value 10.5 with scale 0.1 should become 105
+            (0.1, 0, 100, 10.5, 105),
+            # Value 10 with scale [1,10] (factor of 0.1) should become 100
+            ([1, 10], 0, 100, 10.0, 100),
+            (1, 10, 100, 5, "below minimum"),
+            (1, 0, 100, 150, "above maximum"),
+            # Tiny scale converts to a raw value above 65535
+            (0.001, 0, 100000, 100000, "out of valid register range"),
+            (1, 0, 100, "not a number", "Invalid number value"),
+        ],
+        ids=[
+            "basic_scaling",
+            "list_scaling",
+            "range_validation_min",
+            "range_validation_max",
+            "register_bounds_check",
+            "invalid_value",
+        ],
+    )
+    def test_to_raw(self, number_entity_factory, scale, range_min, range_max, value, expected):
+        """Test scale conversion and rejection of out-of-range or invalid values."""
+        entity = _entity(
+            self.coordinator,
+            *number_entity_factory(scale=scale, range_min=range_min, range_max=range_max),
+        )
+
+        if isinstance(expected, int):
+            assert entity._to_raw(value) == expected
+        else:
+            with pytest.raises(HomeAssistantError, match=expected):
+                entity._to_raw(value)
 
 
 class TestNumberWriteVerification:
     """Test write verification for number entities."""
 
-    @pytest.mark.asyncio
-    async def test_write_verification_success(self):
-        """Test successful write with verification."""
-        coordinator = Mock()
-        coordinator.data = {}
-        coordinator.async_request_refresh = AsyncMock()
-
-        client = AsyncMock()
-        client.async_write_register = AsyncMock()
-
-        # Mock successful read-back
-        read_result = Mock()
-        read_result.isError = Mock(return_value=False)
-        read_result.registers = [100]  # Expected value
-        client.async_read_holding_registers = AsyncMock(return_value=read_result)
-
-        coordinator.hass = Mock()
-        coordinator.hass.data = {
-            "deye_modbus": {
-                "test_entry": {
-                    "client": client
-                }
-            }
-        }
-
-        definition = DefinitionItem(
-            key="battery_max_charging_current",  # Whitelisted key
+    @pytest.fixture
+    def charging_current(self, number_entity_factory):
+        """Whitelisted battery current limit on register 0x0100."""
+        return number_entity_factory(
+            key="battery_max_charging_current",
             name="Battery Max Charging Current",
-            platform="number",
-            registers=[0x0100],
-            scale=1,
-            range_min=0,
             range_max=200,
         )
 
-        from homeassistant.components.number import NumberEntityDescription
-        desc = NumberEntityDescription(
-            key="battery_max_charging_current",
-            name="Battery Max Charging Current"
-        )
-
-        entity = DeyeDefinitionNumber(
-            coordinator=coordinator,
-            description=desc,
-            entry_id="test_entry",
-            definition=definition,
-            device_info={},
-        )
+    async def test_write_verification_success(self, charging_current):
+        """Test successful write with verification."""
+        # Successful read-back of the expected value
+        client = FakeClient(FakeReadResult([100]))
+        coordinator = FakeCoordinator(client)
+        entity = _entity(coordinator, *charging_current)
 
         # Test: write should succeed and verification should pass
         await entity.async_set_native_value(100)
 
-        client.async_write_register.assert_called_once_with(0x0100, 100)
-        client.async_read_holding_registers.assert_called_once_with(0x0100, 1)
-        coordinator.async_request_refresh.assert_called_once()
+        assert client.calls == [(0x0100, 100)]
+        assert client.reads == [(0x0100, 1)]
+        assert coordinator.refresh_requests == 1
 
-    @pytest.mark.asyncio
-    async def test_write_verification_failure(self):
+    async def test_write_verification_failure(self, charging_current):
         """Test write verification detects mismatched values."""
-        coordinator = Mock()
-        coordinator.data = {}
-        coordinator.async_request_refresh = AsyncMock()
+        # Read-back differs from the written value
+        client = FakeClient(FakeReadResult([50]))
+        coordinator = FakeCoordinator(client)
+        entity = _entity(coordinator, *charging_current)
 
-        client = AsyncMock()
-        client.async_write_register = AsyncMock()
+        # Test: write should fail verification
+        with pytest.raises(HomeAssistantError, match="Write verification failed"):
+            await entity.async_set_native_value(100)
 
-        # Mock read-back with different value
-        read_result = Mock()
-        read_result.isError = Mock(return_value=False)
-        read_result.registers = [50]  # Different from written value
-        client.async_read_holding_registers = AsyncMock(return_value=read_result)
+    async def test_write_skipped_when_value_unchanged(self, charging_current):
+        """Test that writing the last polled value skips the Modbus round-trips."""
+        client = FakeClient()
+        coordinator = FakeCoordinator(client, data={"battery_max_charging_current": 100})
+        entity = _entity(coordinator, *charging_current)
 
-        coordinator.hass = Mock()
-        coordinator.hass.data = {
-            "deye_modbus": {
-                "test_entry": {
-                    "client": client
-                }
-            }
-        }
+        # Test: unchanged value should not touch the inverter
+        await entity.async_set_native_value(100)
 
-        definition = DefinitionItem(
-            key="battery_max_charging_current",
-            name="Battery Max Charging Current",
-            platform="number",
-            registers=[0x0100],
-            scale=1,
-            range_min=0,
-            range_max=200,
-        )
+        assert client.calls == []
+        assert client.reads == []
+        assert coordinator.refresh_requests == 0
 
-        from homeassistant.components.number import NumberEntityDescription
-        desc = NumberEntityDescription(
-            key="battery_max_charging_current",
-            name="Battery Max Charging Current"
-        )
+    async def test_forced_write_ignores_polled_value(self, charging_current):
+        """Test that force=True writes even when the last poll already matches."""
+        client = FakeClient(FakeReadResult([100]))
+        coordinator = FakeCoordinator(client, data={"battery_max_charging_current": 100})
+        entity = _entity(coordinator, *charging_current)
+
+        await entity.async_set_native_value(100, force=True)
+
+        assert client.calls == [(0x0100, 100)]
+        assert client.reads == [(0x0100, 1)]
+        assert coordinator.refresh_requests == 1
 
-        entity = DeyeDefinitionNumber(
-            coordinator=coordinator,
-            description=desc,
-            entry_id="test_entry",
-            definition=definition,
-            device_info={},
+    async def test_polled_value_not_skipped_while_write_in_flight(self, charging_current):
+        """Test that restoring the polled value during an earlier write still writes it."""
+        client = FakeClient(FakeReadResult([50]), FakeReadResult([100]))
+        coordinator = FakeCoordinator(client, data={"battery_max_charging_current": 100})
+        entity = _entity(coordinator, *charging_current)
+
+        await asyncio.gather(
+            entity.async_set_native_value(50),
+            entity.async_set_native_value(100),
         )
 
-        # Test: write should fail verification
-        with pytest.raises(HomeAssistantError, match="Write verification failed"):
-            await entity.async_set_native_value(100)
+        # The second call goes out after the first instead of leaving the inverter at 50
+        assert client.calls == [(0x0100, 50), (0x0100, 100)]
+        assert coordinator.data["battery_max_charging_current"] == 100
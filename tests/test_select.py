@@ -1,48 +1,25 @@
 """Tests for select entity write operations with masking."""
 
 import pytest
-from unittest.mock import Mock, AsyncMock
 from homeassistant.exceptions import HomeAssistantError
 
 from custom_components.deye_modbus.select import DeyeDefinitionSelect
-from custom_components.deye_modbus.definition_loader import DefinitionItem
+
+from tests.fakes import FakeClient, FakeCoordinator, FakeReadResult, make_definition
 
 
 class TestSelectMaskedWrites:
     """Test masked write operations for select entities."""
 
-    @pytest.mark.asyncio
     async def test_masked_write_preserves_other_bits(self):
         """Test that masked writes preserve unmasked bits."""
-        coordinator = Mock()
-        coordinator.data = {}
-        coordinator.async_request_refresh = AsyncMock()
-
-        client = AsyncMock()
-
-        # Mock current register value: 0b11110000 (240)
-        current_read = Mock()
-        current_read.isError = Mock(return_value=False)
-        current_read.registers = [0b11110000]
-
-        # Mock verification read
-        verify_read = Mock()
-        verify_read.isError = Mock(return_value=False)
-        verify_read.registers = [0b11110011]  # Expected after masked write
-
-        client.async_read_holding_registers = AsyncMock(side_effect=[current_read, verify_read])
-        client.async_write_register = AsyncMock()
-
-        coordinator.hass = Mock()
-        coordinator.hass.data = {
-            "deye_modbus": {
-                "test_entry": {
-                    "client": client
-                }
-            }
-        }
-
-        definition = DefinitionItem(
+        client = FakeClient(
+            FakeReadResult([0b11110000]),  # Current register value (240)
+            FakeReadResult([0b11110011]),  # Verification read, expected after masked write
+        )
+        coordinator = FakeCoordinator(client)
+
+        definition = make_definition(
             key="program_1_charging",  # Whitelisted key
             name="Program 1 Charging",
             platform="select",
@@ -70,40 +47,18 @@ class TestSelectMaskedWrites:
         await entity.async_select_option("Enabled")
 
         # Verify: should write 0b11110011 (preserving upper 4 bits, setting lower to 0011)
-        client.async_write_register.assert_called_once_with(0x0100, 0b11110011)
+        assert client.calls == [(0x0100, 0b11110011)]
 
-    @pytest.mark.asyncio
     async def test_masked_write_verification(self):
         """Test that masked write verification only checks masked bits."""
-        coordinator = Mock()
-        coordinator.data = {}
-        coordinator.async_request_refresh = AsyncMock()
-
-        client = AsyncMock()
-
-        # Mock current register value
-        current_read = Mock()
-        current_read.isError = Mock(return_value=False)
-        current_read.registers = [0b11110000]
-
-        # Mock verification read - upper bits different, but masked bits match
-        verify_read = Mock()
-        verify_read.isError = Mock(return_value=False)
-        verify_read.registers = [0b10100011]  # Different upper bits, but lower 4 bits = 0011
-
-        client.async_read_holding_registers = AsyncMock(side_effect=[current_read, verify_read])
-        client.async_write_register = AsyncMock()
-
-        coordinator.hass = Mock()
-        coordinator.hass.data = {
-            "deye_modbus": {
-                "test_entry": {
-                    "client": client
-                }
-            }
-        }
-
-        definition = DefinitionItem(
+        client = FakeClient(
+            FakeReadResult([0b11110000]),  # Current register value
+            # Verification read: upper bits differ, but lower 4 bits = 0011
+            FakeReadResult([0b10100011]),
+        )
+        coordinator = FakeCoordinator(client)
+
+        definition = make_definition(
             key="program_1_charging",
             name="Program 1 Charging",
             platform="select",
@@ -129,35 +84,56 @@ class TestSelectMaskedWrites:
 
         # Test: verification should pass even though upper bits differ
         await entity.async_select_option("Enabled")
-        coordinator.async_request_refresh.assert_called_once()
+        assert coordinator.refresh_requests == 1
+
+    async def test_masked_write_uses_fresh_register_snapshot(self):
+        """Test that a recently polled register word replaces the read-before-write."""
+        import time
+
+        # Only the verification read should hit the bus
+        client = FakeClient(FakeReadResult([0b11110011]))
+
+        snapshot = {0x0100: (0b11110000, time.monotonic())}
+        coordinator = FakeCoordinator(client, registers=snapshot)
+
+        definition = make_definition(
+            key="program_1_charging",
+            name="Program 1 Charging",
+            platform="select",
+            registers=[0x0100],
+            mask=0b00001111,
+            lookup={0: "Disabled", 3: "Enabled"},
+        )
+
+        from homeassistant.components.select import SelectEntityDescription
+        desc = SelectEntityDescription(
+            key="program_1_charging",
+            name="Program 1 Charging",
+            options=["Disabled", "Enabled"]
+        )
+
+        entity = DeyeDefinitionSelect(
+            coordinator=coordinator,
+            description=desc,
+            entry_id="test_entry",
+            definition=definition,
+            device_info={},
+        )
+
+        await entity.async_select_option("Enabled")
+
+        assert client.calls == [(0x0100, 0b11110011)]
+        assert len(client.reads) == 1
+        # Snapshot now holds the verified word
+        assert snapshot[0x0100][0] == 0b11110011
 
-    @pytest.mark.asyncio
     async def test_unmasked_write_verification_failure(self):
         """Test that unmasked writes detect value mismatches."""
-        coordinator = Mock()
-        coordinator.data = {}
-        coordinator.async_request_refresh = AsyncMock()
-
-        client = AsyncMock()
-        client.async_write_register = AsyncMock()
-
-        # Mock verification read with wrong value
-        verify_read = Mock()
-        verify_read.isError = Mock(return_value=False)
-        verify_read.registers = [0]  # Wrong value
-
-        client.async_read_holding_registers = AsyncMock(return_value=verify_read)
-
-        coordinator.hass = Mock()
-        coordinator.hass.data = {
-            "deye_modbus": {
-                "test_entry": {
-                    "client": client
-                }
-            }
-        }
-
-        definition = DefinitionItem(
+        # Verification read with wrong value
+        client = FakeClient(FakeReadResult([0]))
+        coordinator = FakeCoordinator(client)
+
+        definition = make_definition(
             key="time_of_use",  # Whitelisted key
             name="Time of Use",
             platform="select",
@@ -185,12 +161,11 @@ class TestSelectMaskedWrites:
         with pytest.raises(HomeAssistantError, match="Write verification failed"):
             await entity.async_select_option("Enabled")
 
-    def test_invalid_option_rejected(self):
+    async def test_invalid_option_rejected(self):
         """Test that invalid options are rejected."""
-        coordinator = Mock()
-        coordinator.data = {}
+        coordinator = FakeCoordinator(FakeClient())
 
-        definition = DefinitionItem(
+        definition = make_definition(
             key="time_of_use",
             name="Time of Use",
             platform="select",
@@ -215,5 +190,4 @@ class TestSelectMaskedWrites:
 
         # Test: invalid option should raise error
         with pytest.raises(HomeAssistantError, match="Invalid option"):
-            import asyncio
-            asyncio.run(entity.async_select_option("InvalidOption"))
+            await entity.async_select_option("InvalidOption")
@@ -0,0 +1,67 @@
+"""Tests for sensor platform setup."""
+
+import pytest
+
+from custom_components.deye_modbus import sensor
+
+from tests.fakes import FakeClient, FakeConfigEntry, FakeCoordinator, make_definition
+
+
+class TestSensorSetup:
+    """Test that definition sensors are added once their key has a value."""
+
+    @pytest.fixture
+    def setup(self):
+        """Coordinator that has polled pv1_power but not battery_soc."""
+        coordinator = FakeCoordinator(FakeClient(), data={"pv1_power": 1200})
+        items = [
+            make_definition(key="pv1_power", name="PV1 Power", platform="sensor", registers=[0x00BA]),
+            make_definition(key="battery_soc", name="Battery SOC", platform="sensor", registers=[0x00B8]),
+        ]
+        coordinator.hass.data["deye_modbus"]["test_entry"]["definitions"] = {
+            "coordinator": coordinator,
+            "items_by_platform": {"sensor": items},
+        }
+        added = []
+
+        def async_add_entities(entities, update_before_add=False):
+            added.append([entity.unique_id for entity in entities])
+
+        return coordinator, FakeConfigEntry(), async_add_entities, added
+
+    async def test_only_present_keys_added_at_setup(self, setup):
+        """Test that keys missing from the first poll are not created at setup."""
+        coordinator, entry, async_add_entities, added = setup
+
+        await sensor.async_setup_entry(coordinator.hass, entry, async_add_entities)
+
+        assert added == [
+            ["test_entry_meta_last_success", "test_entry_meta_last_error", "test_entry_def_pv1_power"]
+        ]
+
+    async def test_pending_key_added_once_when_polled(self, setup):
+        """Test that a deferred sensor is added on the first poll that reports it, and only then."""
+        coordinator, entry, async_add_entities, added = setup
+        await sensor.async_setup_entry(coordinator.hass, entry, async_add_entities)
+        (listener,) = coordinator.listeners
+
+        # Still missing: nothing new
+        listener()
+        assert len(added) == 1
+
+        coordinator.data["battery_soc"] = 87
+        listener()
+        listener()
+
+        assert added[1:] == [["test_entry_def_battery_soc"]]
+
+    async def test_listener_removed_on_unload(self, setup):
+        """Test that the deferred-sensor listener is released through entry.async_on_unload."""
+        coordinator, entry, async_add_entities, _ = setup
+        await sensor.async_setup_entry(coordinator.hass, entry, async_add_entities)
+        assert len(coordinator.listeners) == 1
+
+        for unload in entry.unload_callbacks:
+            unload()
+
+        assert coordinator.listeners == []
@@ -0,0 +1,191 @@
+"""Tests for time entity writes and coalesced time register writes."""
+
+import asyncio
+import datetime
+
+import pytest
+from homeassistant.components.time import TimeEntityDescription
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.deye_modbus.time import DeyeDefinitionTime, _TimeWriteBatcher
+
+from tests.fakes import FakeClient, FakeCoordinator, FakeReadResult, make_definition
+
+
+class TestTimeWriteBatcher:
+    """Test batching of ToU program time writes."""
+
+    async def test_contiguous_writes_coalesced(self):
+        """Test that writes to consecutive registers go out as one multi-register write."""
+        client = FakeClient(FakeReadResult([500, 600, 700]), FakeReadResult([2300]))
+        coordinator = FakeCoordinator(client)
+
+        batcher = _TimeWriteBatcher(coordinator.hass, client, coordinator)
+
+        results = await asyncio.gather(
+            batcher.async_write(251, 600),
+            batcher.async_write(250, 500),
+            batcher.async_write(252, 700),
+            batcher.async_write(255, 2300),
+        )
+
+        # 250-252 form one run; 255 stands alone
+        assert sorted(client.calls) == [(250, [500, 600, 700]), (255, 2300)]
+        # Each run is read back once and every caller gets its own register's value
+        assert client.reads == [(250, 3), (255, 1)]
+        assert results == [600, 500, 700, 2300]
+        # One confirming refresh for the whole flush
+        assert coordinator.refresh_requests == 1
+
+    async def test_write_failure_propagates_to_waiters(self):
+        """Test that every caller in a failed run sees the error."""
+        client = FakeClient(error=ConnectionError("boom"))
+        coordinator = FakeCoordinator(client)
+
+        batcher = _TimeWriteBatcher(coordinator.hass, client, coordinator)
+
+        results = await asyncio.gather(
+            batcher.async_write(250, 500),
+            batcher.async_write(251, 600),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert client.reads == []
+        assert coordinator.refresh_requests == 0
+
+    async def test_failed_read_back_leaves_writes_unverified(self):
+        """Test that an error response on the run read-back resolves callers with None."""
+        client = FakeClient(FakeReadResult([], err=True))
+        coordinator = FakeCoordinator(client)
+
+        batcher = _TimeWriteBatcher(coordinator.hass, client, coordinator)
+
+        results = await asyncio.gather(
+            batcher.async_write(250, 500),
+            batcher.async_write(251, 600),
+        )
+
+        assert client.calls == [(250, [500, 600])]
+        assert results == [None, None]
+
+
+class TestTimeWrites:
+    """Test time entity writes and state attributes."""
+
+    @staticmethod
+    def _entity(coordinator, batcher=None):
+        return DeyeDefinitionTime(
+            coordinator=coordinator,
+            description=TimeEntityDescription(key="program_1_time", name="Program 1 Time"),
+            entry_id="test_entry",
+            definition=make_definition(
+                key="program_1_time",
+                name="Program 1 Time",
+                platform="time",
+                registers=[250],
+            ),
+            device_info={},
+            batcher=batcher,
+        )
+
+    async def test_write_skipped_when_value_unchanged(self):
+        """Test that writing the last polled time skips the Modbus round-trips."""
+        client = FakeClient()
+        coordinator = FakeCoordinator(client, data={"program_1_time": datetime.time(5, 0)})
+        entity = self._entity(coordinator)
+
+        await entity.async_set_value(datetime.time(5, 0))
+
+        assert client.calls == []
+        assert client.reads == []
+        assert coordinator.refresh_requests == 0
+
+    async def test_forced_write_ignores_polled_value(self):
+        """Test that force=True writes even when the last poll already matches."""
+        client = FakeClient(FakeReadResult([500]))
+        coordinator = FakeCoordinator(client, data={"program_1_time": datetime.time(5, 0)})
+        entity = self._entity(coordinator)
+
+        await entity.async_set_value(datetime.time(5, 0), force=True)
+
+        assert client.calls == [(250, 500)]
+        assert coordinator.refresh_requests == 1
+
+    async def test_batched_write_verified_from_run_read_back(self):
+        """Test that a batched write fails verification when its read-back register differs."""
+        client = FakeClient(FakeReadResult([450]))
+        coordinator = FakeCoordinator(client)
+        batcher = _TimeWriteBatcher(coordinator.hass, client, coordinator)
+        entity = self._entity(coordinator, batcher)
+
+        with pytest.raises(HomeAssistantError, match="Write verification failed"):
+            await entity.async_set_value(datetime.time(5, 0))
+
+        # The batcher's read-back was used; the entity did not read again
+        assert client.reads == [(250, 1)]
+
+    async def test_write_no_delay_bypasses_batcher(self):
+        """Test that write_no_delay sends the write immediately with its own read-back."""
+        client = FakeClient(FakeReadResult([500]))
+        coordinator = FakeCoordinator(client)
+        batcher = _TimeWriteBatcher(coordinator.hass, client, coordinator)
+        entity = self._entity(coordinator, batcher)
+        entity.write_no_delay = True
+
+        await entity.async_set_value(datetime.time(5, 0))
+
+        # Single-register write and read-back; nothing queued on the batcher
+        assert client.calls == [(250, 500)]
+        assert client.reads == [(250, 1)]
+        assert batcher._pending == {}
+        assert batcher._timer is None
+        assert coordinator.refresh_requests == 1
+
+    async def test_superseded_write_not_reported_as_mismatch(self):
+        """Test that an earlier value overwritten within the batch window doesn't fail verification."""
+        # The register holds the later value after the batch goes out
+        client = FakeClient(FakeReadResult([630]))
+        coordinator = FakeCoordinator(client)
+        batcher = _TimeWriteBatcher(coordinator.hass, client, coordinator)
+        entity = self._entity(coordinator, batcher)
+
+        await asyncio.gather(
+            entity.async_set_value(datetime.time(5, 0)),
+            entity.async_set_value(datetime.time(6, 30)),
+        )
+
+        # Only the last value is written and read back
+        assert client.calls == [(250, 630)]
+        assert client.reads == [(250, 1)]
+        assert coordinator.data["program_1_time"] == datetime.time(6, 30)
+        # Refreshed once by the batcher, not once per call
+        assert coordinator.refresh_requests == 1
+
+    async def test_polled_value_not_skipped_while_write_queued(self):
+        """Test that restoring the polled time after a queued change still writes it."""
+        client = FakeClient(FakeReadResult([630]))
+        coordinator = FakeCoordinator(client, data={"program_1_time": datetime.time(6, 30)})
+        batcher = _TimeWriteBatcher(coordinator.hass, client, coordinator)
+        entity = self._entity(coordinator, batcher)
+
+        await asyncio.gather(
+            entity.async_set_value(datetime.time(5, 0)),
+            entity.async_set_value(datetime.time(6, 30)),
+        )
+
+        # The queued 05:00 is replaced by 06:30 rather than left to go out on its own
+        assert client.calls == [(250, 630)]
+        assert coordinator.data["program_1_time"] == datetime.time(6, 30)
+
+    def test_state_attributes_reused_until_value_changes(self):
+        """Test that the attribute dict is rebuilt only when the polled time changes."""
+        coordinator = FakeCoordinator(FakeClient(), data={"program_1_time": datetime.time(5, 0)})
+        entity = self._entity(coordinator)
+
+        attrs = entity.extra_state_attributes
+        assert attrs == {"value": datetime.time(5, 0), "device_class": "time"}
+        assert entity.extra_state_attributes is attrs
+
+        coordinator.data["program_1_time"] = datetime.time(6, 30)
+        assert entity.extra_state_attributes == {"value": datetime.time(6, 30), "device_class": "time"}